@@ -1,43 +1,63 @@
-"""A sygnal/livezi chatterbox integration."""
-from __future__ import annotations
-
-from datetime import timedelta
-import logging
-from typing import Any
+"""A sygnal/livezi chatterbox integration.
 
+Home Assistant pieces are imported lazily so that `chatterbox.py` (and
+`cli.py`) can be imported from this package without Home Assistant.
+"""
+from __future__ import annotations
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import update_coordinator
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from typing import TYPE_CHECKING
 
-from . import config_flow  # noqa  pylint_disable=unused-import
-from .chatterbox import SygnalApi, SygnalClient
-from .const import DOMAIN
+from .const import CONF_BRIDGE_PORT, CONF_PIN_ADDRESS, DOMAIN
 
-_LOGGER = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
 
-PLATFORMS = [Platform.SWITCH, Platform.COVER, Platform.CLIMATE, Platform.SENSOR]
+PLATFORMS = ["switch", "cover", "climate", "sensor"]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Sygnal from a config entry."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.const import CONF_HOST
+    from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+    from .chatterbox import SygnalApi, SygnalClient
+    from .coordinator import SygnalDataUpdateCoordinator
+    from .resolver import async_get_resolver
+    from .services import async_setup_services
+
     hass.data.setdefault(DOMAIN, {})
 
     sygnal_connection = SygnalApi(SygnalClient(
         entry.data[CONF_HOST],
         async_get_clientsession(hass),
+        resolver=await async_get_resolver(hass),
     ))
     sygnal_data_coordinator = SygnalDataUpdateCoordinator(
         hass,
+        entry,
         sygnal_connection=sygnal_connection,
     )
+    # The (slow) EEPROM read runs alongside the first VRAM refresh. Only the
+    # zone platforms need it and they add their entities once it lands.
+    sygnal_data_coordinator.async_start_zone_load()
+    await sygnal_data_coordinator.async_load_status_log()
     await sygnal_data_coordinator.async_config_entry_first_refresh()
     hass.data[DOMAIN][entry.entry_id] = sygnal_data_coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    sygnal_data_coordinator.balancer.async_start()
+    entry.async_on_unload(sygnal_data_coordinator.balancer.async_stop)
+
+    await sygnal_data_coordinator.async_configure_bridge(
+        entry.options.get(CONF_BRIDGE_PORT, 0))
+    if entry.options.get(CONF_PIN_ADDRESS):
+        sygnal_data_coordinator.async_pin_address()
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    async_setup_services(hass)
+
     return True
 
 
@@ -45,35 +65,24 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_configure_bridge(0)
+        await coordinator.async_stop_profiling()
 
     return unload_ok
 
 
-class SygnalDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Class to manage fetching Sygnal data."""
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        *,
-        sygnal_connection: chatterbox.SygnalApi,
-    ) -> None:
-        """Initialize global Sygnal data updater."""
-        self.api = sygnal_connection
-
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=5),
-        )
-
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data."""
-        data = await self.api.async_update()
-        #if data is None:
-        #    raise update_coordinator.UpdateFailed(
-        #        "Unable to connect to Sygnal device"
-        #    )
-        return self.api#data
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove data stored for a config entry."""
+    # pylint: disable=import-outside-toplevel
+    from .coordinator import status_log_store
+
+    await status_log_store(hass, entry.entry_id).async_remove()
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options without reloading the entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.async_configure_bridge(entry.options.get(CONF_BRIDGE_PORT, 0))
+    if entry.options.get(CONF_PIN_ADDRESS):
+        coordinator.async_pin_address()
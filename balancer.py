@@ -0,0 +1,190 @@
+"""Closed-loop zone balancing for the sygnal component.
+
+Each balanced zone has a target temperature and a sensor entity measuring the
+room. On every coordinator refresh the damper setpoint (VRAM byte 2+index) is
+nudged towards the target from the actual damper position (byte 47+index),
+never against the demand, and only written when it differs from the
+current setpoint by more than BALANCE_WRITE_THRESHOLD.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .chatterbox import HVAC_AUTO, HVAC_COOL, HVAC_HEAT, SygnalApi
+from .const import (
+    BALANCE_GAIN,
+    BALANCE_HYSTERESIS_ENTER,
+    BALANCE_HYSTERESIS_EXIT,
+    BALANCE_MAX_STEP,
+    BALANCE_MIN_INTERVAL,
+    BALANCE_WRITE_THRESHOLD,
+    CONF_ZONE_TARGETS,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import SygnalDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class ZoneTarget:
+    """Balancing settings and write history for one zone."""
+
+    target_temperature: float
+    sensor: str
+    last_write: float = 0.0
+    # Whether the zone is being driven, i.e. left the enter band and has not
+    # yet come back within the exit band.
+    active: bool = False
+
+
+def balanced_position(api: SygnalApi, zone: str, target: ZoneTarget,
+                      temperature: float) -> int | None:
+    """The damper setpoint `zone` should move to, or None to leave it alone.
+
+    Updates `target.active` as the error crosses the hysteresis thresholds.
+    """
+    if not api.zone_state(zone):
+        target.active = False
+        return None
+    if api.hvac_mode == HVAC_COOL or (api.hvac_mode == HVAC_AUTO and api.is_cooling):
+        # A room warmer than its target wants more cold air.
+        demand = temperature - target.target_temperature
+    elif api.hvac_mode == HVAC_HEAT or (api.hvac_mode == HVAC_AUTO and api.is_heating):
+        demand = target.target_temperature - temperature
+    else:
+        target.active = False
+        return None
+    threshold = BALANCE_HYSTERESIS_EXIT if target.active else BALANCE_HYSTERESIS_ENTER
+    target.active = abs(demand) > threshold
+    if not target.active:
+        return None
+
+    # Step from where the damper actually is rather than the last request, so
+    # a damper held back by its zone min/max limits doesn't wind up. The
+    # actual position lags the setpoint, so never move the setpoint against
+    # the demand (e.g. closing a damper that is still opening).
+    step = max(-BALANCE_MAX_STEP, min(BALANCE_MAX_STEP, round(BALANCE_GAIN * demand)))
+    position = max(0, min(100, api.zone_damper_position(zone) + step))
+    setpoint = api.zone_damper_setpoint(zone)
+    if demand > 0:
+        position = max(position, setpoint)
+    else:
+        position = min(position, setpoint)
+    if abs(position - setpoint) <= BALANCE_WRITE_THRESHOLD:
+        return None
+    return position
+
+
+class ZoneBalancer:
+    """Drives zone dampers towards per-zone target temperatures."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: SygnalDataUpdateCoordinator,
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._targets: dict[str, ZoneTarget] = {
+            zone: ZoneTarget(settings["target_temperature"], settings["sensor"])
+            for zone, settings in entry.options.get(CONF_ZONE_TARGETS, {}).items()
+        }
+        self._remove_listener: CALLBACK_TYPE | None = None
+        self._last_refresh = -1
+
+    @property
+    def targets(self) -> dict[str, ZoneTarget]:
+        return self._targets
+
+    @callback
+    def async_start(self) -> None:
+        """Follow coordinator updates while any zone is being balanced."""
+        if self._targets and self._remove_listener is None:
+            self._remove_listener = self._coordinator.async_add_listener(
+                self._async_on_update)
+
+    @callback
+    def async_stop(self) -> None:
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+
+    @callback
+    def async_set_target(self, zone: str, target_temperature: float,
+                         sensor: str) -> None:
+        self._targets[zone] = ZoneTarget(target_temperature, sensor)
+        self._async_save()
+        self.async_start()
+
+    @callback
+    def async_clear_target(self, zone: str) -> None:
+        self._targets.pop(zone, None)
+        self._async_save()
+        if not self._targets:
+            self.async_stop()
+
+    @callback
+    def _async_save(self) -> None:
+        self._hass.config_entries.async_update_entry(
+            self._entry,
+            options={
+                **self._entry.options,
+                CONF_ZONE_TARGETS: {
+                    zone: {
+                        "target_temperature": target.target_temperature,
+                        "sensor": target.sensor,
+                    }
+                    for zone, target in self._targets.items()
+                },
+            },
+        )
+
+    @callback
+    def _async_on_update(self) -> None:
+        # Failed refreshes and updates that aren't refreshes (e.g. after
+        # wait_for) also notify us; only act on fresh VRAM.
+        refresh_count = self._coordinator.refresh_count
+        if (not self._coordinator.last_update_success
+                or refresh_count == self._last_refresh):
+            return
+        self._last_refresh = refresh_count
+        api = self._coordinator.api
+        now = time.monotonic()
+        for zone, target in self._targets.items():
+            if zone not in api.zones or now - target.last_write < BALANCE_MIN_INTERVAL:
+                continue
+            state = self._hass.states.get(target.sensor)
+            if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                continue
+            try:
+                temperature = float(state.state)
+            except ValueError:
+                continue
+            position = balanced_position(api, zone, target, temperature)
+            if position is None:
+                continue
+            target.last_write = now
+            self._entry.async_create_background_task(
+                self._hass,
+                self._async_write(zone, position),
+                f"{DOMAIN} balance {zone}",
+            )
+
+    async def _async_write(self, zone: str, position: int) -> None:
+        _LOGGER.debug("Balancing zone %s to %s%%", zone, position)
+        try:
+            await self._coordinator.api.async_set_zone_damper_position(zone, position)
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to balance zone %s: %s", zone, error)
@@ -0,0 +1,100 @@
+"""
+Local socket bridge sharing one device poll with any number of consumers.
+
+Clients connect over TCP, send one JSON line to pick the fields they want
+(`{}` for everything, or `{"fields": ["hvac_mode", "zone.Lounge.position"]}`)
+and then receive one JSON line per batch of changes:
+
+    {"device": "chatterbox.local", "changes": {"hvac_mode": "cool"}}
+
+Each client gets its own latest-value-wins subscription, so a slow reader
+never holds up the poll or other readers.
+ """
+from typing import List, Text
+
+import asyncio
+import json
+import logging
+
+try:
+    from .chatterbox import SygnalApi
+except ImportError:
+    from chatterbox import SygnalApi
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+
+
+class StreamBridge():
+    """Serves decoded field changes from one or more SygnalApis."""
+    def __init__(self, apis: List[SygnalApi], host: Text = DEFAULT_HOST,
+                 port: int = 0):
+        self._apis = apis
+        self._host = host
+        self._port = port
+        self._server = None
+        # Handler task -> (writer, subscriptions) of each connected client.
+        self._clients = {}
+
+    @property
+    def port(self) -> int:
+        """The bound port (useful when started with port 0)."""
+        if self._server is None:
+            return self._port
+        return self._server.sockets[0].getsockname()[1]
+
+    async def async_start(self):
+        self._server = await asyncio.start_server(
+            self._handle_client, self._host, self._port)
+        _LOGGER.info("Sygnal bridge listening on %s:%s", self._host, self.port)
+
+    async def async_stop(self):
+        if self._server is None:
+            return
+        self._server.close()
+        # Since Python 3.12 wait_closed() also waits for every connection, so
+        # hang up on connected clients first.
+        for task, (writer, subscriptions) in list(self._clients.items()):
+            for api, subscription in subscriptions:
+                api.unsubscribe(subscription)
+            writer.close()
+            task.cancel()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter):
+        subscriptions = []
+        task = asyncio.current_task()
+        self._clients[task] = (writer, subscriptions)
+        try:
+            request = json.loads((await reader.readline()) or b'{}')
+            fields = request.get('fields') if isinstance(request, dict) else None
+            subscriptions += [(api, api.subscribe(fields))
+                              for api in self._apis]
+
+            async def closed():
+                # Ends the forwarders as soon as the client hangs up.
+                await reader.read()
+                for api, subscription in subscriptions:
+                    api.unsubscribe(subscription)
+
+            await asyncio.gather(closed(), *[
+                self._forward(api, subscription, writer)
+                for api, subscription in subscriptions])
+        except (ConnectionError, ValueError) as error:
+            _LOGGER.debug("Bridge client went away: %s", error)
+        finally:
+            self._clients.pop(task, None)
+            for api, subscription in subscriptions:
+                api.unsubscribe(subscription)
+            writer.close()
+
+    @staticmethod
+    async def _forward(api: SygnalApi, subscription, writer: asyncio.StreamWriter):
+        async for changes in subscription:
+            line = json.dumps({'device': api.name, 'changes': changes})
+            writer.write(line.encode() + b'\n')
+            await writer.drain()
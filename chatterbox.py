@@ -7,12 +7,17 @@ This may not work with more recent devices. YMMV.
 This is provided without warranty and I take no responsibility for what you do
 with this code.
  """
-from typing import Dict, List, Text
+from typing import Awaitable, Callable, Dict, List, Text
 
 import asyncio
+import collections
+import contextvars
 import datetime
+import ipaddress
 import json
 import logging
+import socket
+import time
 
 import aiohttp
 
@@ -33,38 +38,301 @@ FAN_MEDIUM = 'medium'
 FAN_HIGH = 'high'
 FAN_AUTO = 'auto'
 
+# Decoded SygnalApi properties reported by SygnalApi.snapshot(), and the VRAM
+# offsets each is decoded from.
+_SNAPSHOT_FIELDS = {
+    'status': [60],
+    'hvac_mode': [0],
+    'fan_mode': [0],
+    'target_temperature': [1],
+    'current_temperature': [67],
+    'compressor_loading': [62],
+    'outside_coil_temperature': [63],
+    'inside_coil_temperature': [64],
+    'discharge_temperature': [65],
+}
+
+
+DEVICE_INFO_PATH = '/lv-lan-cboxes.json'
+
 
 class InvalidArgument(Exception):
     """Raised if invalid arguments are provided to SygnalClient."""
 
 
+class EepromWriteError(Exception):
+    """Raised if an EEPROM block doesn't read back as written."""
+
+
+class RequestTimings():
+    """Where the requests made in one context spent their time.
+
+    `phases` sums each request's 'throttle', 'network' and 'parse' time, and
+    `waiting` is the wall time during which any request was outstanding, so
+    concurrent requests aren't counted twice.
+    """
+    def __init__(self):
+        self.phases = collections.defaultdict(float)
+        self.waiting = 0.0
+        self._outstanding = 0
+        self._since = 0.0
+
+    def begin(self):
+        if self._outstanding == 0:
+            self._since = time.perf_counter()
+        self._outstanding += 1
+
+    def end(self):
+        self._outstanding -= 1
+        if self._outstanding == 0:
+            self.waiting += time.perf_counter() - self._since
+
+    def add(self, phase: Text, seconds: float):
+        self.phases[phase] += seconds
+
+
+# Set (e.g. by a profiler) to time only the requests made in that context,
+# including tasks it starts.
+REQUEST_TIMINGS: contextvars.ContextVar = contextvars.ContextVar(
+    'sygnal_request_timings', default=None)
+
+
+class LoadGovernor():
+    """Token bucket limiting the request rate to a single device.
+
+    The embedded web server degrades if pushed too hard and its limit isn't
+    known, so the rate is learned AIMD-style: it creeps up while requests are
+    fast and succeed but the bucket is what's holding them back, and halves
+    when one fails or is slower than `latency_target` seconds (at most once
+    per `latency_target`).
+    """
+    def __init__(self, rate: float = 2.0, min_rate: float = 0.2,
+                 max_rate: float = 10.0, burst: float = 4.0,
+                 latency_target: float = 1.0, increase: float = 0.05,
+                 decrease: float = 0.5):
+        self._rate = rate
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._burst = burst
+        self._latency_target = latency_target
+        self._increase = increase
+        self._decrease = decrease
+        self._tokens = burst
+        self._last_refill = time.monotonic()
+        self._last_decrease = 0.0
+        # Whether the bucket has been limiting requests since the last record().
+        self._limited = False
+        self._lock = asyncio.Lock()
+        self._latency = None
+        self.requests = 0
+        self.errors = 0
+        self.slow = 0
+        self.throttled = 0
+
+    @property
+    def rate(self) -> float:
+        """The learned sustainable request rate (requests/second)."""
+        return self._rate
+
+    @property
+    def stats(self) -> Dict:
+        return {
+            'rate': round(self._rate, 3),
+            'latency': None if self._latency is None else round(self._latency, 3),
+            'requests': self.requests,
+            'errors': self.errors,
+            'slow': self.slow,
+            'throttled': self.throttled,
+        }
+
+    async def acquire(self):
+        """Wait for a token. Waiters are served in order."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._burst, self._tokens +
+                                   (now - self._last_refill) * self._rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    if self._tokens < 1:
+                        self._limited = True
+                    return
+                self._limited = True
+                self.throttled += 1
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def record(self, latency: float, ok: bool):
+        """Feed back the outcome of a request to adjust the rate."""
+        self.requests += 1
+        self._latency = latency if self._latency is None else (
+            0.8 * self._latency + 0.2 * latency)
+        limited, self._limited = self._limited, False
+        if ok and latency <= self._latency_target:
+            # Only probe for a higher rate when the current one is in the way.
+            if limited:
+                self._rate = min(self._max_rate, self._rate + self._increase)
+            return
+        if ok:
+            self.slow += 1
+        else:
+            self.errors += 1
+        now = time.monotonic()
+        if now - self._last_decrease >= self._latency_target:
+            self._last_decrease = now
+            self._rate = max(self._min_rate, self._rate * self._decrease)
+
+
+async def async_getaddrinfo(hostname: Text) -> Text:
+    """Resolve `hostname` to an IPv4 address with the OS resolver."""
+    infos = await asyncio.get_running_loop().getaddrinfo(
+        hostname, 80, family=socket.AF_INET, type=socket.SOCK_STREAM)
+    return infos[0][4][0]
+
+
+class AddressCache():
+    """Resolves a hostname once and reuses the address for `ttl` seconds.
+
+    Resolving `chatterbox.local` over mDNS on every request can be slow or
+    flaky. The cached address is dropped by invalidate() (e.g. after a failed
+    request), and a stale address is still used if re-resolving fails.
+    `resolver` is an async callable mapping a hostname to an address and
+    defaults to the OS resolver.
+    """
+    def __init__(self, hostname: Text, ttl: float = 300,
+                 resolver: Callable[[Text], Awaitable[Text]] = None):
+        self._hostname = hostname
+        self._ttl = ttl
+        self._resolver = resolver or async_getaddrinfo
+        self._address = None
+        self._expires = 0.0
+        try:
+            # Nothing to resolve for IP literals.
+            self._address = str(ipaddress.ip_address(hostname))
+            self._expires = float('inf')
+        except ValueError:
+            pass
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+
+    @property
+    def address(self) -> Text:
+        """The last resolved address, if any."""
+        return self._address
+
+    @property
+    def stats(self) -> Dict:
+        return {
+            'hostname': self._hostname,
+            'address': self._address,
+            'hits': self.hits,
+            'misses': self.misses,
+            'failures': self.failures,
+        }
+
+    async def resolve(self) -> Text:
+        if self._address is not None and time.monotonic() < self._expires:
+            self.hits += 1
+            return self._address
+        self.misses += 1
+        try:
+            self._address = await self._resolver(self._hostname)
+            self._expires = time.monotonic() + self._ttl
+        except (OSError, IndexError, KeyError, asyncio.TimeoutError) as error:
+            self.failures += 1
+            if self._address is None:
+                raise aiohttp.ClientError(
+                    f"Failed to resolve {self._hostname}: {error}") from error
+            _LOGGER.debug("Failed to resolve %s, using %s: %s",
+                          self._hostname, self._address, error)
+        return self._address
+
+    def invalidate(self):
+        if self._expires != float('inf'):
+            self._expires = 0.0
+
+
 class SygnalClient():
     """Low-level direct access to Sygnal chatterbox device.
        This exposes device information, VRAM, EEPROM and RTC.
+       All requests are paced by a LoadGovernor and go to an address
+       resolved through an AddressCache, using `resolver` if given and
+       otherwise the OS resolver.
     """
-    def __init__(self, hostname: Text, client_session):
+    def __init__(self, hostname: Text, client_session,
+                 governor: LoadGovernor = None,
+                 resolver: Callable[[Text], Awaitable[Text]] = None):
         self._hostname = hostname
         self._client_session = client_session
+        self._governor = governor or LoadGovernor()
+        self._addresses = AddressCache(hostname, resolver=resolver)
 
     @property
     def hostname(self):
         return self._hostname
 
+    @property
+    def governor(self) -> LoadGovernor:
+        return self._governor
+
+    @property
+    def addresses(self) -> AddressCache:
+        return self._addresses
+
+    async def _url(self, path: Text) -> Text:
+        return f"http://{await self._addresses.resolve()}{path}"
+
+    async def _async_request(self, method: Text, path: Text, **kwargs):
+        """Make a paced request to the device and return its decoded JSON.
+
+        Time spent is added to the caller's REQUEST_TIMINGS, if set.
+        """
+        timings = REQUEST_TIMINGS.get()
+        if timings is not None:
+            timings.begin()
+            start = time.perf_counter()
+        try:
+            await self._governor.acquire()
+            if timings is not None:
+                sent = time.perf_counter()
+                timings.add('throttle', sent - start)
+            start = time.monotonic()
+            ok = False
+            try:
+                response = await self._client_session.request(
+                    method, await self._url(path),
+                    headers={'Host': self._hostname}, **kwargs)
+                text = await response.text()
+                if timings is not None:
+                    received = time.perf_counter()
+                    timings.add('network', received - sent)
+                data = json.loads(text)
+                if timings is not None:
+                    timings.add('parse', time.perf_counter() - received)
+                ok = True
+                return data
+            finally:
+                self._governor.record(time.monotonic() - start, ok)
+                if not ok:
+                    # The device may have moved; re-resolve on the next request.
+                    self._addresses.invalidate()
+        finally:
+            if timings is not None:
+                timings.end()
+
     async def _post(self, data):
         try:
-            response = await self._client_session.post(
-                f"http://{self._hostname}/ZPlus/file.lvjson", data=data)
-            data = json.loads(await response.text())
-            return data
+            return await self._async_request('POST', '/ZPlus/file.lvjson', data=data)
         except (aiohttp.ClientError, IndexError) as error:
             _LOGGER.error("Failed to read/write to chatterbox: %s", error)
 
-    async def get_device_info(self) -> Dict:
+    async def get_device_info(self, timeout: float = None) -> Dict:
+        kwargs = {}
+        if timeout is not None:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
         try:
-            response = await self._client_session.get(
-                f"http://{self._hostname}/lv-lan-cboxes.json")
-            data = json.loads(await response.text())
-            return data
+            return await self._async_request('GET', DEVICE_INFO_PATH, **kwargs)
         except (aiohttp.ClientError, IndexError) as error:
             _LOGGER.error("Failed to read chatterbox device info: %s", error)
             raise error
@@ -120,6 +388,10 @@ class SygnalClient():
         # Can only write 4-byte aligned blocks.
         if length != 4 or offset % 4 or len(value) != 4:
             raise InvalidArgument('Can only write 4 byte aligned blocks.')
+        # NOTE: This packet layout hasn't been checked against traffic from the
+        # vendor web UI. In particular it doesn't carry `offset`. Until it is
+        # confirmed, treat EEPROM writes as experimental; SygnalApi reads every
+        # written block back and stops at the first mismatch.
         data = json.dumps({'method': 'send_packet', 'id': 1, 'params': [
                           {'marker': "eew", 'cmd': 7, 'data': value}]})
         await self._post(data)
@@ -141,17 +413,246 @@ class SygnalClient():
         raise NotImplementedError()
 
 
+async def async_probe(hosts: List[Text], client_session, concurrency: int = 64,
+                      timeout: float = 1.5) -> Dict[Text, Dict]:
+    """Probe many hosts for chatterbox devices at once.
+
+    Returns a mapping of host to device info for every host that answered with
+    something that looks like a chatterbox. Failures are expected (most hosts
+    on a subnet aren't chatterboxes) and aren't logged.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def probe(host):
+        async with semaphore:
+            try:
+                response = await client_session.get(
+                    f"http://{host}{DEVICE_INFO_PATH}", timeout=client_timeout)
+                info = json.loads(await response.text())
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                return None
+        if not isinstance(info, dict) or 'mac' not in info.get('local', {}):
+            return None
+        return host, info
+
+    results = await asyncio.gather(*[probe(host) for host in hosts])
+    return dict(result for result in results if result is not None)
+
+
+STATUS_COMPRESSOR_RUNNING = 0x10
+
+
+class StatusLog():
+    """Run-length encoded history of the status byte (VRAM 60).
+
+    Each run is `[start_time, status]` and lasts until the next run starts, so
+    a poll that sees no change costs nothing but a comparison. Compressor
+    counters are maintained incrementally as transitions are recorded.
+    A compressor run shorter than `short_cycle` seconds counts as a short cycle.
+    """
+    def __init__(self, max_runs: int = 2000, short_cycle: float = 300):
+        self._runs = collections.deque(maxlen=max_runs)
+        self._short_cycle = short_cycle
+        self._recent_starts = collections.deque()
+        self._last_start = None
+        self._last_seen = None
+        self._restored = False
+        # Whether the open run started before a restore, so its length is unknown.
+        self._partial_run = False
+        self.starts = 0
+        self.short_cycles = 0
+        self._run_time = 0.0
+        self.transitions = 0
+
+    @property
+    def runs(self) -> List[List]:
+        return list(self._runs)
+
+    @property
+    def compressor_running(self) -> bool:
+        return self._last_start is not None
+
+    def record(self, now: float, status: int) -> bool:
+        """Record a polled status byte. Returns whether it changed."""
+        restored, self._restored = self._restored, False
+        last_seen, self._last_seen = self._last_seen, now
+        running = status & STATUS_COMPRESSOR_RUNNING
+        if restored and self._last_start is not None:
+            # Nobody polled while e.g. Home Assistant restarted. Only count the
+            # run up to when it was last seen, and carry on from now if it's
+            # still running. As the run's real length is unknown it isn't
+            # judged a short cycle.
+            self._run_time += max(0.0, (last_seen or self._last_start) - self._last_start)
+            self._last_start = now if running else None
+            self._partial_run = True
+        previous = self._runs[-1][1] if self._runs else None
+        if status == previous:
+            return False
+        self._runs.append([now, status])
+        self.transitions += 1
+        was_running = previous is not None and previous & STATUS_COMPRESSOR_RUNNING
+        if running and not was_running:
+            self.starts += 1
+            self._recent_starts.append(now)
+            self._last_start = now
+            self._partial_run = False
+        elif was_running and not running and self._last_start is not None:
+            run = now - self._last_start
+            self._run_time += run
+            if run < self._short_cycle and not self._partial_run:
+                self.short_cycles += 1
+            self._last_start = None
+        return True
+
+    def starts_per_hour(self, now: float) -> int:
+        """Compressor starts within the last hour."""
+        while self._recent_starts and self._recent_starts[0] <= now - 3600:
+            self._recent_starts.popleft()
+        return len(self._recent_starts)
+
+    def run_time(self, now: float) -> float:
+        """Cumulative compressor run time in seconds, including any current run."""
+        if self._last_start is None:
+            return self._run_time
+        return self._run_time + now - self._last_start
+
+    def as_dict(self) -> Dict:
+        return {
+            'runs': list(self._runs),
+            'recent_starts': list(self._recent_starts),
+            'last_start': self._last_start,
+            'last_seen': self._last_seen,
+            'starts': self.starts,
+            'short_cycles': self.short_cycles,
+            'run_time': self._run_time,
+            'transitions': self.transitions,
+        }
+
+    def restore(self, data: Dict):
+        """Restore state saved by as_dict()."""
+        self._runs.clear()
+        self._runs.extend(data.get('runs', []))
+        self._recent_starts = collections.deque(data.get('recent_starts', []))
+        self._last_start = data.get('last_start')
+        # Older saves have no last_seen; their open run ends at its last change.
+        self._last_seen = data.get('last_seen') or (
+            self._runs[-1][0] if self._runs else None)
+        self._restored = True
+        self.starts = data.get('starts', 0)
+        self.short_cycles = data.get('short_cycles', 0)
+        self._run_time = data.get('run_time', 0.0)
+        self.transitions = data.get('transitions', 0)
+
+
+class Subscription():
+    """A stream of decoded field changes from a SygnalApi.
+
+    Only the latest value of each field is kept until it is consumed, so a slow
+    consumer sees fewer, fresher updates rather than an ever-growing backlog.
+    At most one value per field is pending, so the backlog is bounded.
+    """
+    def __init__(self, fields: List[Text] = None):
+        self._fields = set(fields) if fields else None
+        self._pending = {}
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.dropped = 0
+
+    def wants(self, field: Text) -> bool:
+        return self._fields is None or field in self._fields
+
+    def publish(self, changes: Dict[Text, object]):
+        for field, value in changes.items():
+            if not self.wants(field):
+                continue
+            if field in self._pending:
+                # Replaced by a newer value before it was consumed.
+                del self._pending[field]
+                self.dropped += 1
+            self._pending[field] = value
+        if self._pending:
+            self._ready.set()
+
+    async def get(self) -> Dict[Text, object]:
+        """Wait for and return the pending changes (field -> latest value)."""
+        while not self._pending:
+            if self._closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        changes, self._pending = self._pending, {}
+        return changes
+
+    def close(self):
+        self._closed = True
+        self._ready.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[Text, object]:
+        return await self.get()
+
+
+def _matches(value, wanted, tolerance: float) -> bool:
+    numeric = (int, float)
+    if (isinstance(value, numeric) and isinstance(wanted, numeric)
+            and not isinstance(value, bool) and not isinstance(wanted, bool)):
+        return abs(value - wanted) <= tolerance
+    return value == wanted
+
+
 class SygnalApi():
     """High-level access to Sygnal chatterbox device.
        This provides user-facing configuration, caches state, etc.
+       Decoded field changes are published to any subscribe()rs.
     """
+    # Seconds between the targeted re-reads made by async_wait_for().
+    wait_interval = 0.5
+
     def __init__(self, client):
         self._client = client
         self._vram = [0] * 69
+        self._vram_loaded = False
         self._eeprom = [0] * 150
         # self._rtc = "Mon 00:00:00"
         self._zones = {}
         self._device_info = {}
+        self._subscriptions = []
+        self._published = {}
+        self._status_log = StatusLog()
+        self._waiters = []
+        self._wait_poll = None
+
+    def subscribe(self, fields: List[Text] = None) -> Subscription:
+        """Subscribe to changes of `fields` (default: all snapshot() fields).
+
+        The subscription starts with the current value of every field.
+        """
+        if not self._subscriptions and self._vram_loaded:
+            self._published = self.snapshot()
+        subscription = Subscription(fields)
+        subscription.publish(self._published)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscription.close()
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def _publish_changes(self):
+        # Nothing is decoded unless someone is listening.
+        if not self._subscriptions:
+            return
+        snapshot = self.snapshot()
+        changes = {field: value for field, value in snapshot.items()
+                   if field not in self._published or self._published[field] != value}
+        self._published = snapshot
+        if changes:
+            for subscription in self._subscriptions:
+                subscription.publish(changes)
 
     async def _async_read_full_eeprom(self):
         eeprom = []
@@ -168,32 +669,255 @@ class SygnalApi():
                     "Exception reading EEPROM range [%s:%s]: %s", len(eeprom),end, error)
         return eeprom
 
-    async def async_update(self):
+    async def async_update_vram(self):
         self._vram = await self._client.async_read_vram(0, 69)
+        self._vram_loaded = True
+        self._status_log.record(time.time(), self._vram[60])
+        self._publish_changes()
 
+    async def async_update_eeprom(self):
+        """Read the full EEPROM. Call update_zones() once VRAM is also read."""
+        self._eeprom = await self._async_read_full_eeprom()
+
+    async def async_update_device_info(self):
+        self._device_info = await self._client.get_device_info()
+
+    @property
+    def eeprom_loaded(self) -> bool:
+        return self._eeprom[0] != 0
+
+    def update_zones(self):
+        """Rebuild the zone map from the EEPROM names and the VRAM zone mask."""
+        self._zones = {}
+        for i in range(8):
+            if self._zone_mask & (1 << i):
+                name = ''.join([chr(c)
+                               for c in self._eeprom[i * 8:(i + 1) * 8]]).rstrip()
+                self._zones[name] = i
+        self._publish_changes()
+
+    async def async_update(self):
+        """Refresh everything, reading independent regions concurrently."""
+        reads = [self.async_update_vram(), self.async_update_device_info()]
         # The eeprom shouldn't change often so we don't bother refreshing it.
-        if self._eeprom[0] == 0:
-            self._eeprom = await self._async_read_full_eeprom()
-            self._zones = {}
-            for i in range(8):
-                if self._zone_mask & (1 << i):
-                    name = ''.join([chr(c)
-                                   for c in self._eeprom[i * 8:(i + 1) * 8]]).rstrip()
-                    self._zones[name] = i
+        load_zones = not self.eeprom_loaded
+        if load_zones:
+            reads.append(self.async_update_eeprom())
+        await asyncio.gather(*reads)
+        if load_zones:
+            self.update_zones()
 
         # self._rtc = await self._client.async_read_rtc()
 
-        self._device_info = await self._client.get_device_info()
+    async def async_write_eeprom(self, image: List[int]) -> List[int]:
+        """Make the EEPROM match `image`, writing only the blocks that differ.
+
+        Changed 4-byte blocks are written in order and each is read back before
+        moving on, so a failure leaves every earlier block verified. The cached
+        image and zone map are updated as blocks land, and re-read from the
+        device if a write fails. Returns the offsets written. The last two
+        bytes (148-149) aren't block-writable.
+        """
+        if not self.eeprom_loaded:
+            raise InvalidArgument("EEPROM must be read before it is edited")
+        if len(image) != len(self._eeprom):
+            raise InvalidArgument(f"Image length {len(image)} != {len(self._eeprom)}")
+        if any(not 0 <= b <= 255 for b in image):
+            raise InvalidArgument("Image values must be bytes")
+        writable = len(self._eeprom) - len(self._eeprom) % 4
+        if image[writable:] != self._eeprom[writable:]:
+            raise InvalidArgument(f"Bytes from {writable} can't be written")
+
+        written = []
+        sent = False
+        try:
+            for offset in range(0, writable, 4):
+                block = list(image[offset:offset + 4])
+                if block == self._eeprom[offset:offset + 4]:
+                    continue
+                sent = True
+                await self._client.async_write_eeprom(offset, 4, block)
+                readback = await self._client.async_read_eeprom(offset, 4)
+                try:
+                    readback = readback[0]['values']
+                except (KeyError, IndexError, TypeError):
+                    readback = None
+                if readback != block:
+                    raise EepromWriteError(
+                        f"EEPROM block {offset} read back {readback}, wrote {block}")
+                self._eeprom[offset:offset + 4] = block
+                written.append(offset)
+        except Exception:
+            if sent:
+                # A failed write may have landed anywhere (the write packet
+                # carries no offset), so the cache can't be trusted.
+                await self._async_resync_eeprom()
+            raise
+        # Zone names occupy the first 64 bytes.
+        if written and written[0] < 64:
+            self.update_zones()
+        return written
+
+    async def _async_resync_eeprom(self):
+        """Re-read the whole EEPROM after a failed edit."""
+        try:
+            await self.async_update_eeprom()
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.error("Failed to re-read EEPROM after a failed write: %s", error)
+            # Refuse further edits until the EEPROM has been read again.
+            self._eeprom = [0] * len(self._eeprom)
+            return
+        self.update_zones()
+
+    async def async_set_eeprom(self, offset: int, data: List[int]) -> List[int]:
+        """Change `data` bytes starting at `offset` (see async_write_eeprom)."""
+        if offset < 0 or offset + len(data) > len(self._eeprom):
+            raise InvalidArgument(f"Range out of bounds: {offset}+{len(data)}")
+        image = list(self._eeprom)
+        image[offset:offset + len(data)] = data
+        return await self.async_write_eeprom(image)
+
+    async def async_rename_zone(self, name: Text, new_name: Text):
+        """Rename a zone (at most 8 ASCII characters)."""
+        if name not in self._zones:
+            raise InvalidArgument(f"Bad zone ({name} not in {self._zones})")
+        new_name = new_name.rstrip()
+        if not new_name or len(new_name) > 8 or not new_name.isascii():
+            raise InvalidArgument(f"Zone names must be 1-8 ASCII characters: {new_name!r}")
+        if new_name != name and new_name in self._zones:
+            raise InvalidArgument(f"Zone {new_name} already exists")
+        index = self._zones[name]
+        await self.async_set_eeprom(index * 8, [ord(c) for c in new_name.ljust(8)])
 
     async def async_write_vram(self, offset, mask, value):
         await self._client.async_write_vram(offset, mask, value)
         self._vram[offset] = self._vram[offset] & (0xff ^ mask)
         self._vram[offset] = self._vram[offset] | (mask & value)
+        self._publish_changes()
 
     @property
     def name(self):
         return self._client.hostname
 
+    @property
+    def client(self) -> SygnalClient:
+        return self._client
+
+    @property
+    def request_rate(self):
+        """Learned sustainable request rate to the device (requests/second)."""
+        return round(self._client.governor.rate, 2)
+
+    @property
+    def vram(self) -> List[int]:
+        """A copy of the cached raw VRAM image."""
+        return list(self._vram)
+
+    @property
+    def eeprom(self) -> List[int]:
+        """A copy of the cached raw EEPROM image."""
+        return list(self._eeprom)
+
+    def raw(self, region: Text, offset: int, length: int) -> List[int]:
+        """Raw bytes from the cached 'vram' or 'eeprom' image."""
+        image = self._vram if region == 'vram' else self._eeprom
+        return image[offset:offset + length]
+
+    def snapshot(self) -> Dict[Text, object]:
+        """Decoded state as a flat mapping of field name to value.
+
+        Zone fields are named `zone.<name>.enabled` and `zone.<name>.position`.
+        """
+        fields = {name: getattr(self, name) for name in _SNAPSHOT_FIELDS}
+        for zone in self._zones:
+            fields[f'zone.{zone}.enabled'] = self.zone_state(zone)
+            fields[f'zone.{zone}.position'] = self.zone_damper_position(zone)
+        return fields
+
+    def _parse_field(self, field: Text):
+        """Split a snapshot() field name into (value getter, VRAM offsets)."""
+        if field in _SNAPSHOT_FIELDS:
+            return (lambda: getattr(self, field)), _SNAPSHOT_FIELDS[field]
+        if field.startswith('zone.'):
+            zone, _, attribute = field[len('zone.'):].rpartition('.')
+            if zone in self._zones and attribute == 'enabled':
+                return (lambda: self.zone_state(zone)), [2 + self._zones[zone]]
+            if zone in self._zones and attribute == 'position':
+                return ((lambda: self.zone_damper_position(zone)),
+                        [47 + self._zones[zone]])
+        raise InvalidArgument(f"Unknown field: {field}")
+
+    async def async_wait_for(self, targets, timeout: float,
+                             tolerance: float = 0, offsets: List[int] = None) -> bool:
+        """Wait for the device to reach a state, e.g. a damper to settle.
+
+        `targets` is either a mapping of snapshot() field to wanted value
+        (numbers match within `tolerance`) or a predicate taking this
+        SygnalApi, which is checked against re-reads of `offsets` (default:
+        all of VRAM). Only the VRAM range covering the relevant bytes is
+        re-read, every `wait_interval` seconds, and concurrent waits share
+        those reads. Returns whether the state was reached within `timeout`.
+        """
+        if callable(targets):
+            predicate = targets
+            offsets = list(range(69)) if offsets is None else offsets
+        else:
+            checks = []
+            offsets = []
+            for field, wanted in targets.items():
+                getter, field_offsets = self._parse_field(field)
+                checks.append((getter, wanted))
+                offsets += field_offsets
+
+            def predicate(_):
+                return all(_matches(getter(), wanted, tolerance)
+                           for getter, wanted in checks)
+
+        if not offsets:
+            raise InvalidArgument("Nothing to wait for: no targets or offsets")
+        if any(not 0 <= offset < 69 for offset in offsets):
+            raise InvalidArgument(f"VRAM offsets out of range: {offsets}")
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = (set(offsets), predicate, future)
+        self._waiters.append(waiter)
+        if self._wait_poll is None or self._wait_poll.done():
+            self._wait_poll = asyncio.create_task(self._async_poll_waiters())
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    async def _async_poll_waiters(self):
+        """Re-read the bytes all current waiters need until none are left."""
+        while self._waiters:
+            wanted = set().union(*[offsets for offsets, _, _ in self._waiters])
+            start, end = min(wanted), max(wanted) + 1
+            try:
+                values = await self._client.async_read_vram(start, end - start)
+            except Exception as error:  # pylint: disable=broad-except
+                _LOGGER.debug("Wait read of VRAM [%s:%s] failed: %s", start, end, error)
+                values = None
+            if values is not None and len(values) == end - start:
+                self._vram[start:end] = values
+                self._publish_changes()
+                for waiter in list(self._waiters):
+                    _, predicate, future = waiter
+                    try:
+                        done = future.done() or predicate(self)
+                    except Exception as error:  # pylint: disable=broad-except
+                        future.set_exception(error)
+                        done = True
+                    if done:
+                        if not future.done():
+                            future.set_result(True)
+                        self._waiters.remove(waiter)
+            if self._waiters:
+                await asyncio.sleep(self.wait_interval)
+
     @property
     def unique_id(self):
         return self._device_info['local']['mac'].replace(':', '')
@@ -218,6 +942,25 @@ class SygnalApi():
                   for i in range(8) if self._vram[60] & (1 << i)]
         return 'Idle' if not status else ', '.join(status)
 
+    @property
+    def status_log(self) -> StatusLog:
+        return self._status_log
+
+    @property
+    def compressor_starts_per_hour(self):
+        """Compressor starts in the last hour."""
+        return self._status_log.starts_per_hour(time.time())
+
+    @property
+    def compressor_run_time(self):
+        """Cumulative compressor run time (hours)."""
+        return round(self._status_log.run_time(time.time()) / 3600, 2)
+
+    @property
+    def compressor_short_cycles(self):
+        """Number of compressor runs that were too short."""
+        return self._status_log.short_cycles
+
     @property
     def compressor_loading(self):
         """Percentage loading of digital scroll compressor"""
@@ -344,6 +1087,21 @@ class SygnalApi():
         index = self._zones[name]
         return self._vram[47 + index]
 
+    def zone_damper_setpoint(self, name: Text):
+        """Read the requested damper position (0-100) for a given zone."""
+        if name not in self._zones:
+            raise InvalidArgument(f"Bad zone ({name} not in {self._zones})")
+        index = self._zones[name]
+        return self._vram[2 + index] & 0x7f
+
+    @property
+    def is_cooling(self):
+        return self._vram[60] & 0x01 != 0
+
+    @property
+    def is_heating(self):
+        return self._vram[60] & 0x02 != 0
+
     async def async_set_zone_damper_position(self, name: str, position: int):
         """Set the zone damper position (0-100) for when zone is enabled."""
         if name not in self._zones:
@@ -359,30 +1117,3 @@ class SygnalApi():
         index = self._zones[name]
         val = 0x80 if enabled else 0x00
         await self.async_write_vram(2 + index, 0x80, val)
-
-
-if __name__ == "__main__":
-    async def main():
-        """Basic code exercises and debug output."""
-        async with aiohttp.ClientSession() as session:
-            api = SygnalApi(SygnalClient('chatterbox', session))
-
-            await api.async_update()
-
-            print('id', api.unique_id)
-            print('device_info', api.device_info)
-            print('status', api.status)
-            print('current_temperature', api.current_temperature)
-            print('target_temperature', api.target_temperature)
-            print('compressor_loading', api.compressor_loading)
-            print('outside_coil_temperature', api.outside_coil_temperature)
-            print('inside_coil_temperature', api.inside_coil_temperature)
-            print('discharge_temperature', api.discharge_temperature)
-            print('hvac_mode', api.hvac_mode)
-            print('fan_mode', api.fan_mode)
-            print('zones', api.zones)
-            for zone in api.zones:
-                print(f"  {zone}: {api.zone_damper_position(zone)}")
-
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(main())
@@ -0,0 +1,288 @@
+"""
+Command-line diagnostics for one or many Sygnal chatterbox devices.
+
+This only needs aiohttp and can be run directly from this directory, e.g.:
+
+    python cli.py watch --interval 2 chatterbox-1.local chatterbox-2.local
+    python cli.py dump --format json chatterbox.local > before.json
+    python cli.py diff before.json after.json
+    python cli.py set -v mode=cool -v temperature=21.5 -v zone.Lounge=on host1 host2
+    python cli.py serve --port 8765 chatterbox-1.local chatterbox-2.local
+ """
+from typing import Callable, Dict, List, Text
+
+import argparse
+import asyncio
+import datetime
+import json
+import sys
+
+import aiohttp
+
+try:
+    from .bridge import DEFAULT_HOST, StreamBridge
+    from .chatterbox import SygnalApi, SygnalClient
+except ImportError:
+    from bridge import DEFAULT_HOST, StreamBridge
+    from chatterbox import SygnalApi, SygnalClient
+
+_REGIONS = ['vram', 'eeprom']
+
+
+def _format_hex(host: Text, dump: Dict[Text, List[int]], width: int = 16) -> Text:
+    lines = [f'[{host}]']
+    for region, data in dump.items():
+        for offset in range(0, len(data), width):
+            row = ' '.join(f'{b:02x}' for b in data[offset:offset + width])
+            lines.append(f'{region} {offset:04x}: {row}')
+    return '\n'.join(lines)
+
+
+def _parse_hex(text: Text) -> Dict[Text, Dict[Text, List[int]]]:
+    dumps = {}
+    host = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('[') and line.endswith(']'):
+            host = line[1:-1]
+            dumps[host] = {}
+            continue
+        if host is None:
+            raise ValueError(f'Data before host header: {line!r}')
+        prefix, _, row = line.partition(':')
+        region, offset = prefix.split()
+        data = dumps[host].setdefault(region, [])
+        if int(offset, 16) != len(data):
+            raise ValueError(f'Non-contiguous dump at {line!r}')
+        data.extend(int(b, 16) for b in row.split())
+    return dumps
+
+
+def _load_dump(path: Text) -> Dict[Text, Dict[Text, List[int]]]:
+    with open(path, encoding='utf-8') as dump_file:
+        text = dump_file.read()
+    if text.lstrip().startswith('{'):
+        return json.loads(text)
+    return _parse_hex(text)
+
+
+def _diff_dumps(old: Dict, new: Dict) -> List[Text]:
+    """Byte-level differences between two dumps, one line per changed byte."""
+    if len(old) == 1 and len(new) == 1 and old.keys() != new.keys():
+        # Comparing two single-device dumps of differently named hosts.
+        pairs = [(f'{next(iter(old))} -> {next(iter(new))}',
+                  next(iter(old.values())), next(iter(new.values())))]
+    else:
+        pairs = [(host, old.get(host, {}), new.get(host, {}))
+                 for host in sorted(old.keys() | new.keys())]
+    lines = []
+    for host, old_regions, new_regions in pairs:
+        for region in sorted(old_regions.keys() | new_regions.keys()):
+            old_data = old_regions.get(region, [])
+            new_data = new_regions.get(region, [])
+            for offset in range(max(len(old_data), len(new_data))):
+                before = old_data[offset] if offset < len(old_data) else None
+                after = new_data[offset] if offset < len(new_data) else None
+                if before != after:
+                    lines.append(f'{host} {region}[{offset}]: {before} -> {after}')
+    return lines
+
+
+def _parse_on_off(value: Text) -> bool:
+    if value.lower() in ('on', 'true', '1'):
+        return True
+    if value.lower() in ('off', 'false', '0'):
+        return False
+    raise ValueError(f'Expected on/off, got {value!r}')
+
+
+async def _apply_setting(api: SygnalApi, key: Text, value: Text,
+                         experimental_eeprom: bool = False):
+    """Apply a single KEY=VALUE assignment from the `set` command."""
+    if key == 'power':
+        if _parse_on_off(value):
+            await api.async_turn_on()
+        else:
+            await api.async_turn_off()
+    elif key == 'mode':
+        if value not in api.hvac_modes():
+            raise ValueError(f'Bad mode {value!r}, expected one of {api.hvac_modes()}')
+        await api.async_set_hvac_mode(value)
+    elif key == 'fan':
+        if value not in api.fan_modes():
+            raise ValueError(f'Bad fan mode {value!r}, expected one of {api.fan_modes()}')
+        await api.async_set_fan_mode(value)
+    elif key == 'temperature':
+        await api.async_set_temperature(float(value))
+    elif key.startswith('zone.'):
+        await api.async_set_zone_state(key[len('zone.'):], _parse_on_off(value))
+    elif key.startswith('damper.'):
+        await api.async_set_zone_damper_position(key[len('damper.'):], int(value))
+    elif key.startswith('rename.'):
+        if not experimental_eeprom:
+            raise ValueError('Renaming zones writes the EEPROM, whose write packet '
+                             'is unconfirmed; pass --experimental-eeprom to try it')
+        await api.async_rename_zone(key[len('rename.'):], value)
+    else:
+        raise ValueError(f'Unknown setting {key!r}')
+
+
+async def _poll(api: SygnalApi, args, semaphore: asyncio.Semaphore):
+    while True:
+        async with semaphore:
+            try:
+                await api.async_update()
+            except Exception as error:  # pylint: disable=broad-except
+                print(f'{api.name}: {type(error).__name__}: {error}', file=sys.stderr)
+        await asyncio.sleep(args.interval)
+
+
+async def _watch(api: SygnalApi, args, semaphore: asyncio.Semaphore):
+    async def show():
+        async for changes in api.subscribe(args.fields):
+            now = datetime.datetime.now().isoformat(timespec='seconds')
+            for field, value in changes.items():
+                print(f'{now} {api.name} {field}: {value}', flush=True)
+
+    await asyncio.gather(show(), _poll(api, args, semaphore))
+
+
+async def _serve(args) -> Dict:
+    """Poll every host and share the changes through a StreamBridge."""
+    semaphore = asyncio.Semaphore(args.concurrency)
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        apis = [SygnalApi(SygnalClient(host, session)) for host in args.hosts]
+        bridge = StreamBridge(apis, args.bind, args.port)
+        await bridge.async_start()
+        print(f'Serving {len(apis)} device(s) on {args.bind}:{bridge.port}',
+              file=sys.stderr)
+        try:
+            await asyncio.gather(*[_poll(api, args, semaphore) for api in apis])
+        finally:
+            await bridge.async_stop()
+    return {}
+
+
+async def _dump(api: SygnalApi, args, semaphore: asyncio.Semaphore):
+    async with semaphore:
+        await api.async_update()
+    dump = {region: getattr(api, region) for region in args.region}
+    return {api.name: dump}
+
+
+async def _set(api: SygnalApi, args, semaphore: asyncio.Semaphore):
+    async with semaphore:
+        await api.async_update()
+        for assignment in args.values:
+            key, _, value = assignment.partition('=')
+            await _apply_setting(api, key.strip(), value.strip(),
+                                 args.experimental_eeprom)
+
+
+async def _run_for_hosts(args, action: Callable) -> Dict:
+    """Run `action` against every host, at most `args.concurrency` at a time."""
+    semaphore = asyncio.Semaphore(args.concurrency)
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        apis = [SygnalApi(SygnalClient(host, session)) for host in args.hosts]
+        results = await asyncio.gather(
+            *[action(api, args, semaphore) for api in apis],
+            return_exceptions=True)
+    outcome = {}
+    for api, result in zip(apis, results):
+        if isinstance(result, Exception):
+            print(f'{api.name}: {type(result).__name__}: {result}', file=sys.stderr)
+        outcome[api.name] = result
+    return outcome
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Field diagnostics for Sygnal/Livezi chatterbox devices.')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Maximum number of devices talked to at once.')
+    parser.add_argument('--timeout', type=float, default=10.0,
+                        help='Per-request timeout in seconds.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    watch = commands.add_parser('watch', help='Stream changed fields.')
+    watch.add_argument('--interval', type=float, default=5.0,
+                       help='Seconds between polls of each device.')
+    watch.add_argument('--fields', nargs='+',
+                       help='Only report these fields (see `snapshot`).')
+    watch.add_argument('hosts', nargs='+')
+
+    dump = commands.add_parser('dump', help='Dump raw VRAM/EEPROM.')
+    dump.add_argument('--format', choices=['hex', 'json'], default='hex')
+    dump.add_argument('--region', choices=_REGIONS, action='append',
+                      help='Region(s) to dump (default: all).')
+    dump.add_argument('hosts', nargs='+')
+
+    diff = commands.add_parser('diff', help='Compare two dumps (hex or json).')
+    diff.add_argument('old')
+    diff.add_argument('new')
+
+    set_ = commands.add_parser(
+        'set', help='Apply settings to every listed device.')
+    set_.add_argument(
+        '-v', '--value', dest='values', action='append', required=True,
+        metavar='KEY=VALUE',
+        help='power=on|off, mode=<hvac mode>, fan=<fan mode>, '
+             'temperature=<celsius>, zone.<name>=on|off, damper.<name>=<0-100>, '
+             'rename.<name>=<new name> (needs --experimental-eeprom)')
+    set_.add_argument(
+        '--experimental-eeprom', action='store_true',
+        help='Allow settings that write the EEPROM. Its write packet layout '
+             'is unconfirmed; keep a dump first.')
+    set_.add_argument('hosts', nargs='+')
+
+    serve = commands.add_parser(
+        'serve', help='Poll devices and share changes over a local socket.')
+    serve.add_argument('--interval', type=float, default=5.0,
+                       help='Seconds between polls of each device.')
+    serve.add_argument('--bind', default=DEFAULT_HOST)
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('hosts', nargs='+')
+    return parser
+
+
+def main(argv: List[Text] = None) -> int:
+    args = _build_parser().parse_args(argv)
+
+    if args.command == 'diff':
+        lines = _diff_dumps(_load_dump(args.old), _load_dump(args.new))
+        print('\n'.join(lines) if lines else 'No differences.')
+        return 1 if lines else 0
+
+    if args.command == 'dump':
+        args.region = args.region or _REGIONS
+        results = asyncio.run(_run_for_hosts(args, _dump))
+        dumps = {}
+        for result in results.values():
+            if not isinstance(result, Exception):
+                dumps.update(result)
+        if args.format == 'json':
+            print(json.dumps(dumps, indent=2))
+        else:
+            print('\n'.join(_format_hex(host, dump) for host, dump in dumps.items()))
+    elif args.command == 'watch':
+        try:
+            results = asyncio.run(_run_for_hosts(args, _watch))
+        except KeyboardInterrupt:
+            return 0
+    elif args.command == 'serve':
+        try:
+            results = asyncio.run(_serve(args))
+        except KeyboardInterrupt:
+            return 0
+    else:
+        results = asyncio.run(_run_for_hosts(args, _set))
+
+    return 2 if any(isinstance(r, Exception) for r in results.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
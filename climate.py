@@ -19,6 +19,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
+from .coordinator import SygnalDataUpdateCoordinator
 from .entity import SygnalEntity
 
 HVAC_MODE_TO_SYGNAL = {
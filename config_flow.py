@@ -1,25 +1,43 @@
 """Config flow for Sygnal integration."""
 from __future__ import annotations
 
+import asyncio
+import ipaddress
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.components import network
 from homeassistant.const import CONF_NAME, CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import format_mac
 
-from .chatterbox import SygnalClient
-from .const import DOMAIN
+from .chatterbox import SygnalClient, async_probe
+from .const import (
+    CONF_BRIDGE_PORT,
+    CONF_PIN_ADDRESS,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_MIN_PREFIX,
+    DISCOVERY_TIMEOUT,
+    DOMAIN,
+)
+from .resolver import async_get_resolver
+
+if TYPE_CHECKING:
+    from homeassistant.components.dhcp import DhcpServiceInfo
+    from homeassistant.components.zeroconf import ZeroconfServiceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
+CONF_DEVICE = "device"
+MANUAL_ENTRY = "manual"
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST, default='chatterbox.local'): str,
@@ -37,11 +55,13 @@ user.
     """
     sygnal_client = SygnalClient(data[CONF_HOST],
                                  async_get_clientsession(hass),
+                                 resolver=await async_get_resolver(hass),
                                  )
 
     try:
-        device_info = await sygnal_client.get_device_info()
-    except aiohttp.ClientError as exp:
+        device_info = await sygnal_client.get_device_info(
+            timeout=DISCOVERY_TIMEOUT * 2)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exp:
         raise CannotConnect from exp
 
     if device_info is None or "local" not in device_info:
@@ -51,18 +71,131 @@ user.
     return {"title": local.get("device"), "unique_id": format_mac(local["mac"])}
 
 
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+async def async_discover_devices(hass: HomeAssistant) -> dict[str, dict[str, str]]:
+    """Probe the local subnets for chatterboxes.
+
+    Returns a mapping of formatted MAC address to host and title, so a device
+    reachable on several addresses is only offered once.
+    """
+    hosts: set[str] = set()
+    for adapter in await network.async_get_adapters(hass):
+        if not adapter["enabled"]:
+            continue
+        for ip_info in adapter["ipv4"]:
+            address = ipaddress.ip_address(ip_info["address"])
+            if address.is_loopback or address.is_link_local:
+                continue
+            prefix = ip_info["network_prefix"]
+            if prefix < DISCOVERY_MIN_PREFIX:
+                prefix = 24
+            subnet = ipaddress.ip_network(f"{address}/{prefix}", strict=False)
+            hosts.update(str(host) for host in subnet.hosts() if host != address)
+
+    found = await async_probe(
+        sorted(hosts),
+        async_get_clientsession(hass),
+        concurrency=DISCOVERY_CONCURRENCY,
+        timeout=DISCOVERY_TIMEOUT,
+    )
+    devices = {}
+    for host, device_info in found.items():
+        local = device_info["local"]
+        devices.setdefault(format_mac(local["mac"]), {
+            "host": host,
+            "title": local.get("device") or host,
+        })
+    return devices
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Sygnal."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._discovered: dict[str, dict[str, str]] = {}
+        self._scan_task: asyncio.Task | None = None
+        self._discovered_host: str | None = None
+        self._discovered_title: str | None = None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Scan the LAN for devices, showing progress while it runs."""
+        if self._scan_task is None:
+            self._scan_task = self.hass.async_create_task(
+                async_discover_devices(self.hass), f"{DOMAIN} discovery scan"
+            )
+        if not self._scan_task.done():
+            return self.async_show_progress(
+                step_id="user",
+                progress_action="scan",
+                progress_task=self._scan_task,
+            )
+        try:
+            found = self._scan_task.result()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("LAN scan failed")
+            found = {}
+        configured = self._async_current_ids()
+        self._discovered = {
+            mac: device for mac, device in found.items() if mac not in configured
+        }
+        return self.async_show_progress_done(next_step_id="pick_device")
+
+    async def async_step_pick_device(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Offer devices found on the LAN, falling back to manual entry."""
+        if user_input is None:
+            if not self._discovered:
+                return await self.async_step_manual()
+            choices = {
+                mac: f"{device['title']} ({device['host']})"
+                for mac, device in self._discovered.items()
+            }
+            choices[MANUAL_ENTRY] = "Enter address manually"
+            return self.async_show_form(
+                step_id="pick_device",
+                data_schema=vol.Schema({vol.Required(CONF_DEVICE): vol.In(choices)}),
+            )
+
+        if user_input[CONF_DEVICE] == MANUAL_ENTRY:
+            return await self.async_step_manual()
+
+        mac = user_input[CONF_DEVICE]
+        device = self._discovered[mac]
+        await self.async_set_unique_id(mac)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=device["title"],
+            data={CONF_HOST: device["host"], CONF_NAME: device["title"]},
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a manually entered host."""
         if user_input is None:
             return self.async_show_form(
-                step_id="user", data_schema=STEP_USER_DATA_SCHEMA
+                step_id="manual", data_schema=STEP_USER_DATA_SCHEMA
             )
 
         errors = {}
@@ -81,7 +214,103 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_dhcp(self, discovery_info: DhcpServiceInfo) -> FlowResult:
+        """Handle a device found via DHCP."""
+        # DHCP gives us the MAC, so known devices are updated without a probe.
+        await self.async_set_unique_id(format_mac(discovery_info.macaddress))
+        self._abort_if_unique_id_configured(
+            updates=self._async_host_updates(discovery_info.ip))
+        return await self._async_handle_discovery(discovery_info.ip)
+
+    async def async_step_zeroconf(
+        self, discovery_info: ZeroconfServiceInfo
+    ) -> FlowResult:
+        """Handle a device found via zeroconf."""
+        return await self._async_handle_discovery(str(discovery_info.host))
+
+    async def _async_handle_discovery(self, host: str) -> FlowResult:
+        """Confirm a discovered host is a chatterbox and track it by MAC."""
+        try:
+            info = await validate_input(self.hass, {CONF_HOST: host})
+        except CannotConnect:
+            return self.async_abort(reason="cannot_connect")
+
+        await self.async_set_unique_id(info["unique_id"])
+        self._abort_if_unique_id_configured(updates=self._async_host_updates(host))
+
+        self._discovered_host = host
+        self._discovered_title = info["title"] or host
+        self.context["title_placeholders"] = {"name": self._discovered_title}
+        return await self.async_step_discovery_confirm()
+
+    @callback
+    def _async_host_updates(self, host: str) -> dict[str, str] | None:
+        """Entry data to update when an already configured device is found.
+
+        Only entries already set up by IP address (or opted into pinning the
+        resolved address) follow the discovered IP; a hostname the user entered,
+        such as chatterbox.local, is kept.
+        """
+        for entry in self._async_current_entries(include_ignore=False):
+            if entry.unique_id != self.unique_id:
+                continue
+            if _is_ip_address(entry.data[CONF_HOST]) or entry.options.get(
+                    CONF_PIN_ADDRESS):
+                return {CONF_HOST: host}
+        return None
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask the user to add a discovered device."""
+        if user_input is None:
+            return self.async_show_form(
+                step_id="discovery_confirm",
+                description_placeholders={
+                    "name": self._discovered_title,
+                    "host": self._discovered_host,
+                },
+            )
+        return self.async_create_entry(
+            title=self._discovered_title,
+            data={CONF_HOST: self._discovered_host, CONF_NAME: self._discovered_title},
+        )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Sygnal options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            # Keep options managed elsewhere (e.g. zone balancing targets).
+            return self.async_create_entry(
+                title="", data={**self._config_entry.options, **user_input}
+            )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_BRIDGE_PORT,
+                        default=self._config_entry.options.get(CONF_BRIDGE_PORT, 0),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
+                    vol.Required(
+                        CONF_PIN_ADDRESS,
+                        default=self._config_entry.options.get(CONF_PIN_ADDRESS, False),
+                    ): bool,
+                }
+            ),
         )
 
 
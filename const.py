@@ -2,3 +2,32 @@
 
 DEFAULT_NAME = "Sygnal"
 DOMAIN = "sygnal"
+
+# LAN discovery: how many hosts are probed at once and for how long.
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_TIMEOUT = 1.5
+# Subnets larger than this are narrowed to the /24 around our own address.
+DISCOVERY_MIN_PREFIX = 22
+
+# Zone balancing: start once more than BALANCE_HYSTERESIS_ENTER (C) from the
+# target and stop again once within BALANCE_HYSTERESIS_EXIT. While balancing,
+# move the damper BALANCE_GAIN % per degree of error, at most
+# BALANCE_MAX_STEP % per write, no more often than BALANCE_MIN_INTERVAL
+# seconds, and only when the position changes by more than
+# BALANCE_WRITE_THRESHOLD %.
+BALANCE_HYSTERESIS_ENTER = 0.5
+BALANCE_HYSTERESIS_EXIT = 0.2
+BALANCE_GAIN = 15
+BALANCE_MAX_STEP = 10
+BALANCE_MIN_INTERVAL = 60
+BALANCE_WRITE_THRESHOLD = 5
+CONF_ZONE_TARGETS = "zone_targets"
+
+# Local socket bridge streaming decoded changes to other services (0 = off).
+CONF_BRIDGE_PORT = "bridge_port"
+
+# How long (s) to wait for an mDNS answer when resolving `.local` hosts.
+MDNS_TIMEOUT = 3
+
+# Switch the entry's host to the resolved IP once the device MAC is confirmed.
+CONF_PIN_ADDRESS = "pin_address"
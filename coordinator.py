@@ -0,0 +1,257 @@
+"""Data update coordinator for the sygnal component."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+import logging
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .balancer import ZoneBalancer
+from .bridge import StreamBridge
+from .chatterbox import REQUEST_TIMINGS, SygnalApi
+from .const import DOMAIN
+from .profiling import CycleProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+STATUS_LOG_VERSION = 1
+STATUS_LOG_SAVE_DELAY = 60
+# While the compressor runs, save this often so a restart can close the run
+# close to when it was last seen.
+STATUS_LOG_RUNNING_SAVE_INTERVAL = 300
+
+
+def status_log_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Storage for an entry's compressor/status event log."""
+    return Store(hass, STATUS_LOG_VERSION, f"{DOMAIN}.{entry_id}.status_log")
+
+
+class SygnalDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Class to manage fetching Sygnal data."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        *,
+        sygnal_connection: SygnalApi,
+    ) -> None:
+        """Initialize global Sygnal data updater."""
+        self.api = sygnal_connection
+        self._entry = entry
+        self._vram_ready = asyncio.Event()
+        self._zone_load: asyncio.Task | None = None
+        self._zone_listeners: list[Callable[[], None]] = []
+        self.zones_ready = False
+        # Completed refreshes, so listeners can tell them from other updates.
+        self.refresh_count = 0
+        self.balancer = ZoneBalancer(hass, entry, self)
+        self._bridge: StreamBridge | None = None
+        self._status_log_store = status_log_store(hass, entry.entry_id)
+        self._status_log_saved = 0
+        self._status_log_saved_at = 0.0
+        self.profiler: CycleProfiler | None = None
+        # (region, offset, length) -> [update callback, last bytes seen]
+        self._raw_trackers: dict[tuple[str, int, int], list] = {}
+        self._remove_raw_listener: CALLBACK_TYPE | None = None
+        # (last_update_success, eeprom_loaded) at the last raw dispatch.
+        self._raw_status: tuple[bool, bool] | None = None
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=5),
+        )
+
+    @callback
+    def async_add_zone_listener(self, zones_ready: Callable[[], None]) -> None:
+        """Call `zones_ready` once the zone map is known (now, if it already is)."""
+        if self.zones_ready:
+            zones_ready()
+        else:
+            self._zone_listeners.append(zones_ready)
+
+    @callback
+    def async_start_zone_load(self) -> None:
+        """Start reading the EEPROM zone map unless a read is already running."""
+        if self.zones_ready or (self._zone_load and not self._zone_load.done()):
+            return
+        self._zone_load = self._entry.async_create_background_task(
+            self.hass, self._async_load_zones(), f"{DOMAIN} zone load"
+        )
+
+    async def _async_load_zones(self) -> None:
+        try:
+            await self.api.async_update_eeprom()
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to read zones, will retry: %s", error)
+            return
+        # The zone mask lives in VRAM.
+        await self._vram_ready.wait()
+        self.api.update_zones()
+        self.zones_ready = True
+        # EEPROM raw registers just became available.
+        self._async_dispatch_raw()
+        listeners, self._zone_listeners = self._zone_listeners, []
+        for zones_ready in listeners:
+            zones_ready()
+
+    @callback
+    def async_track_raw(
+        self,
+        region: str,
+        offset: int,
+        length: int,
+        update: Callable[[list[int]], None],
+    ) -> CALLBACK_TYPE:
+        """Call `update` with a raw register's bytes whenever they change.
+
+        `update` is also called when availability may have changed, i.e. when
+        a refresh starts or stops failing or the EEPROM is first loaded. Only
+        enabled raw register entities track themselves, and they share a
+        single coordinator listener, so disabled ones cost nothing per poll.
+        """
+        key = (region, offset, length)
+        self._raw_trackers[key] = [update, self.api.raw(region, offset, length)]
+        if self._remove_raw_listener is None:
+            self._remove_raw_listener = self.async_add_listener(
+                self._async_dispatch_raw)
+
+        @callback
+        def remove() -> None:
+            self._raw_trackers.pop(key, None)
+            if not self._raw_trackers and self._remove_raw_listener is not None:
+                self._remove_raw_listener()
+                self._remove_raw_listener = None
+
+        return remove
+
+    @callback
+    def _async_dispatch_raw(self) -> None:
+        status = (self.last_update_success, self.api.eeprom_loaded)
+        status_changed = status != self._raw_status
+        self._raw_status = status
+        for (region, offset, length), tracker in self._raw_trackers.items():
+            data = self.api.raw(region, offset, length)
+            if status_changed or data != tracker[1]:
+                tracker[1] = data
+                tracker[0](data)
+
+    @callback
+    def async_pin_address(self) -> None:
+        """Point the entry at the resolved IP instead of its (mDNS) hostname.
+
+        Only done once the device answering at that address has the MAC the
+        entry was set up with.
+        """
+        address = self.api.client.addresses.address
+        if address is None or address == self._entry.data[CONF_HOST]:
+            return
+        local = self.api.device_info.get("local", {})
+        if "mac" not in local or format_mac(local["mac"]) != self._entry.unique_id:
+            _LOGGER.warning(
+                "Not pinning %s to %s: device MAC doesn't match",
+                self._entry.data[CONF_HOST], address)
+            return
+        _LOGGER.info("Pinning %s to %s", self._entry.data[CONF_HOST], address)
+        self.hass.config_entries.async_update_entry(
+            self._entry, data={**self._entry.data, CONF_HOST: address})
+
+    async def async_configure_bridge(self, port: int) -> None:
+        """Serve decoded changes on a local socket, or stop if `port` is 0."""
+        if self._bridge is not None:
+            if self._bridge.port == port:
+                return
+            await self._bridge.async_stop()
+            self._bridge = None
+        if not port:
+            return
+        bridge = StreamBridge([self.api], port=port)
+        try:
+            await bridge.async_start()
+        except OSError as error:
+            _LOGGER.error("Failed to start bridge on port %s: %s", port, error)
+            return
+        self._bridge = bridge
+
+    async def async_load_status_log(self) -> None:
+        """Restore the persisted status log before the first refresh."""
+        if data := await self._status_log_store.async_load():
+            self.api.status_log.restore(data)
+        self._status_log_saved = self.api.status_log.transitions
+
+    @callback
+    def async_start_profiling(self, cycles: int, mode: str) -> None:
+        """Profile the next `cycles` refreshes, then write a report."""
+        if self.profiler is not None:
+            self.profiler.stop()
+        self.profiler = CycleProfiler(self.hass, self, cycles, mode)
+
+    async def async_stop_profiling(self) -> str | None:
+        """Stop profiling and write a report of the cycles so far."""
+        if (profiler := self.profiler) is None:
+            return None
+        self.profiler = None
+        profiler.stop()
+        return await profiler.async_write_report()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing them while profiling."""
+        if (profiler := self.profiler) is None:
+            super().async_update_listeners()
+            return
+        profiler.begin_dispatch()
+        super().async_update_listeners()
+        if profiler.end_dispatch():
+            self._entry.async_create_background_task(
+                self.hass, self.async_stop_profiling(), f"{DOMAIN} profile report"
+            )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data."""
+        token = None
+        if (profiler := self.profiler) is not None:
+            # Only this refresh's requests are timed, not the zone load,
+            # balancer writes or wait_for polls running alongside it.
+            token = REQUEST_TIMINGS.set(profiler.begin_fetch())
+        try:
+            data = await self._async_fetch()
+        finally:
+            if token is not None:
+                REQUEST_TIMINGS.reset(token)
+                profiler.end_fetch()
+        self.refresh_count += 1
+        # Started outside the timed context, so its requests aren't counted.
+        self.async_start_zone_load()
+        return data
+
+    async def _async_fetch(self) -> SygnalApi:
+        if self._vram_ready.is_set():
+            await self.api.async_update_vram()
+        else:
+            await asyncio.gather(
+                self.api.async_update_vram(),
+                self.api.async_update_device_info(),
+            )
+            self._vram_ready.set()
+        status_log = self.api.status_log
+        now = time.monotonic()
+        if status_log.transitions != self._status_log_saved or (
+                status_log.compressor_running
+                and now - self._status_log_saved_at >= STATUS_LOG_RUNNING_SAVE_INTERVAL):
+            self._status_log_saved = status_log.transitions
+            self._status_log_saved_at = now
+            self._status_log_store.async_delay_save(
+                status_log.as_dict, STATUS_LOG_SAVE_DELAY)
+        return self.api
@@ -13,25 +13,48 @@ from homeassistant.components.cover import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_CLOSED, STATE_OPEN
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+import voluptuous as vol
 
-from . import SygnalDataUpdateCoordinator
 from .const import DOMAIN
+from .coordinator import SygnalDataUpdateCoordinator
 from .entity import SygnalEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 STATES_MAP = {0: STATE_CLOSED, 1: STATE_OPEN}
 
+SERVICE_SET_ZONE_TARGET = "set_zone_target"
+SERVICE_CLEAR_ZONE_TARGET = "clear_zone_target"
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up a cover for each zone damper."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = [SygnalCover(coordinator, zone)
-                for zone in coordinator.api.zones]
-    async_add_entities(entities)
+
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SET_ZONE_TARGET,
+        {
+            vol.Required("target_temperature"): vol.Coerce(float),
+            vol.Required("sensor"): cv.entity_id,
+        },
+        "async_set_zone_target",
+    )
+    platform.async_register_entity_service(
+        SERVICE_CLEAR_ZONE_TARGET, {}, "async_clear_zone_target"
+    )
+
+    @callback
+    def async_add_zone_entities() -> None:
+        async_add_entities([SygnalCover(coordinator, zone)
+                            for zone in coordinator.api.zones])
+
+    # Zone names come from the EEPROM, which may still be loading.
+    coordinator.async_add_zone_listener(async_add_zone_entities)
 
 
 class SygnalCover(SygnalEntity, CoverEntity):
@@ -66,9 +89,28 @@ class SygnalCover(SygnalEntity, CoverEntity):
         await self.coordinator.api.async_set_zone_damper_position(
             self._zone, kwargs[ATTR_POSITION])
 
+    async def async_set_zone_target(self, target_temperature: float,
+                                    sensor: str) -> None:
+        """Balance this zone's damper to hold `sensor` at a temperature."""
+        self.coordinator.balancer.async_set_target(
+            self._zone, target_temperature, sensor)
+        self._update_attr()
+        self.async_write_ha_state()
+
+    async def async_clear_zone_target(self) -> None:
+        """Stop balancing this zone."""
+        self.coordinator.balancer.async_clear_target(self._zone)
+        self._update_attr()
+        self.async_write_ha_state()
+
     @callback
     def _update_attr(self) -> None:
         status = self.coordinator.api
+        target = self.coordinator.balancer.targets.get(self._zone)
+        self._attr_extra_state_attributes = {
+            "target_temperature": target.target_temperature if target else None,
+            "temperature_sensor": target.sensor if target else None,
+        }
         self._attr_is_closed = not self.coordinator.api.zone_state(self._zone)
         self._attr_current_cover_position = self.coordinator.api.zone_damper_position(
             self._zone)
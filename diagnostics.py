@@ -0,0 +1,25 @@
+"""Diagnostics support for the sygnal component."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    api = coordinator.api
+    return {
+        "device_info": api.device_info,
+        "governor": api.client.governor.stats,
+        "addresses": api.client.addresses.stats,
+        "status_log": api.status_log.as_dict(),
+        "vram": api.vram,
+        "eeprom": api.eeprom,
+    }
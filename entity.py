@@ -1,12 +1,15 @@
 """Entity for the sygnal component."""
 from __future__ import annotations
 
+import time
+
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DOMAIN, SygnalDataUpdateCoordinator
+from .const import DOMAIN
+from .coordinator import SygnalDataUpdateCoordinator
 
 
 class SygnalEntity(CoordinatorEntity[SygnalDataUpdateCoordinator]):
@@ -37,7 +40,12 @@ class SygnalEntity(CoordinatorEntity[SygnalDataUpdateCoordinator]):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._update_attr()
+        if (profiler := self.coordinator.profiler) is not None:
+            start = time.perf_counter()
+            self._update_attr()
+            profiler.add("entity_decode", time.perf_counter() - start)
+        else:
+            self._update_attr()
         self.async_write_ha_state()
 
     @property
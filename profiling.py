@@ -0,0 +1,176 @@
+"""Opt-in per-cycle profiling for the sygnal component.
+
+A CycleProfiler attached to the coordinator breaks each refresh cycle into
+phases and, after the requested number of cycles, writes a report that can be
+attached to bug reports:
+
+    throttle  waiting for the load governor
+    network   waiting on the device
+    parse     decoding JSON responses
+    decode    SygnalApi decoding (status log, subscriptions, entity attributes)
+    dispatch  entity state writes, excluding their decode time
+
+The optional cProfile capture only covers the synchronous dispatch (entity
+decode and state writes): during the fetch the event loop runs other work
+between awaits, which a profiler would attribute to this cycle.
+"""
+from __future__ import annotations
+
+import cProfile
+from collections import defaultdict
+import io
+import logging
+import pstats
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .chatterbox import RequestTimings
+
+if TYPE_CHECKING:
+    from .coordinator import SygnalDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+MODE_TIMING = "timing"
+MODE_CPROFILE = "cprofile"
+MODE_TRACEMALLOC = "tracemalloc"
+MODES = [MODE_TIMING, MODE_CPROFILE, MODE_TRACEMALLOC]
+
+PHASES = ["throttle", "network", "parse", "decode", "dispatch", "total"]
+
+
+class CycleProfiler:
+    """Collects phase timings (and optionally cProfile/tracemalloc) per cycle."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: SygnalDataUpdateCoordinator,
+        cycles: int,
+        mode: str = MODE_TIMING,
+    ) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._cycles_wanted = cycles
+        self._mode = mode
+        self._cycles: list[dict[str, float]] = []
+        self._cycle: dict[str, float] | None = None
+        self._timings: RequestTimings | None = None
+        self._cycle_start = 0.0
+        self._fetch_start = 0.0
+        self._dispatch_start = 0.0
+        self._profile = cProfile.Profile() if mode == MODE_CPROFILE else None
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._started_tracemalloc = False
+        if mode == MODE_TRACEMALLOC and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def add(self, phase: str, seconds: float) -> None:
+        if self._cycle is not None:
+            self._cycle[phase] += seconds
+
+    def begin_fetch(self) -> RequestTimings:
+        """Start a cycle, at the beginning of a coordinator refresh.
+
+        The caller times the refresh's own requests by setting the returned
+        RequestTimings as chatterbox.REQUEST_TIMINGS while it fetches.
+        """
+        self._cycle = defaultdict(float)
+        self._timings = RequestTimings()
+        self._cycle_start = self._fetch_start = time.perf_counter()
+        return self._timings
+
+    def end_fetch(self) -> None:
+        if self._cycle is None or self._timings is None:
+            return
+        fetch = time.perf_counter() - self._fetch_start
+        for phase in ("throttle", "network", "parse"):
+            self._cycle[phase] += self._timings.phases[phase]
+        # Requests can overlap, so use the wall time any was outstanding.
+        self._cycle["decode"] += max(0.0, fetch - self._timings.waiting)
+        self._timings = None
+
+    def begin_dispatch(self) -> None:
+        if self._profile is not None and self._cycle is not None:
+            self._profile.enable()
+        self._dispatch_start = time.perf_counter()
+
+    def end_dispatch(self) -> bool:
+        """Finish the cycle. Returns True once enough cycles are collected."""
+        if self._cycle is None:
+            return False
+        now = time.perf_counter()
+        cycle = self._cycle
+        # Entities report the time spent in _update_attr as entity_decode.
+        entity_decode = cycle.pop("entity_decode", 0.0)
+        cycle["decode"] += entity_decode
+        cycle["dispatch"] = now - self._dispatch_start - entity_decode
+        cycle["total"] = now - self._cycle_start
+        self._cycles.append(dict(cycle))
+        self._cycle = None
+        if self._profile is not None:
+            self._profile.disable()
+        return len(self._cycles) >= self._cycles_wanted
+
+    def stop(self) -> None:
+        """Stop collecting, including any tracemalloc tracing we started."""
+        self._timings = None
+        if self._profile is not None:
+            self._profile.disable()
+        self._cycle = None
+        if (self._mode == MODE_TRACEMALLOC and self._snapshot is None
+                and tracemalloc.is_tracing()):
+            self._snapshot = tracemalloc.take_snapshot()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    def report(self) -> str:
+        """Render collected cycles (and any profile) as text."""
+        lines = [
+            f"Sygnal profile for {self._coordinator.api.name} "
+            f"({self._mode}, {len(self._cycles)} cycles) at {dt_util.now().isoformat()}",
+            "",
+            "cycle " + " ".join(f"{phase:>10}" for phase in PHASES) + "  (ms)",
+        ]
+        for number, cycle in enumerate(self._cycles):
+            lines.append(f"{number:>5} " + " ".join(
+                f"{cycle.get(phase, 0.0) * 1000:>10.2f}" for phase in PHASES))
+        if self._cycles:
+            lines.append("mean  " + " ".join(
+                f"{sum(c.get(phase, 0.0) for c in self._cycles) / len(self._cycles) * 1000:>10.2f}"
+                for phase in PHASES))
+        if self._profile is not None and self._cycles:
+            stream = io.StringIO()
+            pstats.Stats(self._profile, stream=stream).sort_stats(
+                pstats.SortKey.CUMULATIVE).print_stats(40)
+            lines += [
+                "",
+                "cProfile of entity dispatch only (top 40 by cumulative time)",
+                stream.getvalue(),
+            ]
+        if self._snapshot is not None:
+            lines += ["", "tracemalloc (top 30 by line)"]
+            lines += [str(stat) for stat in self._snapshot.statistics("lineno")[:30]]
+        return "\n".join(lines) + "\n"
+
+    async def async_write_report(self) -> str:
+        """Write the report to the config directory and return its path."""
+        path = self._hass.config.path(
+            f"sygnal_profile_{self._coordinator.api.name}_"
+            f"{dt_util.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        )
+        report = self.report()
+
+        def write() -> None:
+            with open(path, "w", encoding="utf-8") as report_file:
+                report_file.write(report)
+
+        await self._hass.async_add_executor_job(write)
+        _LOGGER.warning("Wrote Sygnal profile to %s", path)
+        return path
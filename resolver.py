@@ -0,0 +1,40 @@
+"""Hostname resolution for SygnalClient inside Home Assistant.
+
+Kept apart from the coordinator so the config flow can use it cheaply.
+"""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+
+from .chatterbox import async_getaddrinfo
+from .const import MDNS_TIMEOUT
+
+
+async def async_get_resolver(hass: HomeAssistant) -> Callable[[str], Awaitable[str]]:
+    """A hostname resolver for SygnalClient that works inside Home Assistant.
+
+    `.local` names are looked up through Home Assistant's zeroconf instance,
+    as the OS resolver in Home Assistant OS/containers often can't. Other
+    names, and any zeroconf doesn't answer, use the OS resolver.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from zeroconf import AddressResolverIPv4, IPVersion
+
+        from homeassistant.components import zeroconf
+    except ImportError:
+        return async_getaddrinfo
+    aiozc = await zeroconf.async_get_async_instance(hass)
+
+    async def resolve(hostname: str) -> str:
+        if hostname.endswith(".local"):
+            resolver = AddressResolverIPv4(f"{hostname}.")
+            if await resolver.async_request(aiozc.zeroconf, MDNS_TIMEOUT * 1000):
+                addresses = resolver.parsed_addresses(IPVersion.V4Only)
+                if addresses:
+                    return addresses[0]
+        return await async_getaddrinfo(hostname)
+
+    return resolve
@@ -15,12 +15,13 @@ from homeassistant.const import (
     PERCENTAGE,
     EntityCategory,
     UnitOfTemperature,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import SygnalDataUpdateCoordinator
 from .const import DOMAIN
+from .coordinator import SygnalDataUpdateCoordinator
 from .entity import SygnalEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,14 +50,42 @@ SENSORS: [SensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
+    SensorEntityDescription(
+        key="compressor_starts_per_hour",
+        native_unit_of_measurement="starts/h",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="compressor_run_time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="compressor_short_cycles",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="request_rate",
+        native_unit_of_measurement="req/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
 )
 
+# Every VRAM byte, and the EEPROM in (writable) 4-byte blocks.
+RAW_REGISTERS = [("vram", offset, 1) for offset in range(69)] + [
+    ("eeprom", offset, min(4, 150 - offset)) for offset in range(0, 150, 4)
+]
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities = [SygnalSensor(coordinator, desc) for desc in SENSORS]
+    entities += [SygnalRawSensor(coordinator, entry.unique_id, *register)
+                 for register in RAW_REGISTERS]
     async_add_entities(entities)
 
 
@@ -76,3 +105,64 @@ class SygnalSensor(SygnalEntity, SensorEntity):
     def _update_attr(self) -> None:
         self._attr_native_value = getattr(
             self.coordinator.api, self.entity_description.key)
+
+
+class SygnalRawSensor(SygnalEntity, SensorEntity):
+    """A raw VRAM byte or EEPROM block, for reverse engineering.
+
+    These are disabled by default. Rather than listening to every coordinator
+    update, enabled ones register with the coordinator, which calls back only
+    when their bytes or availability change.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: SygnalDataUpdateCoordinator, device_id: str,
+                 region: str, offset: int, length: int) -> None:
+        self._region = region
+        self._offset = offset
+        self._length = length
+        if length == 1:
+            key = f"{region}_{offset}"
+            name = f"{region.upper()} {offset}"
+        else:
+            key = f"{region}_{offset}_{offset + length - 1}"
+            name = f"{region.upper()} {offset}-{offset + length - 1}"
+        super().__init__(coordinator, device_id, SensorEntityDescription(
+            key=key,
+            name=name,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ))
+
+    async def async_added_to_hass(self) -> None:
+        """Track our bytes instead of adding a per-entity coordinator listener."""
+        # Skips CoordinatorEntity.async_added_to_hass on purpose.
+        await SensorEntity.async_added_to_hass(self)
+        self.async_on_remove(self.coordinator.async_track_raw(
+            self._region, self._offset, self._length, self._async_raw_changed))
+
+    @property
+    def available(self) -> bool:
+        if self._region == "eeprom" and not self.coordinator.api.eeprom_loaded:
+            return False
+        return super().available
+
+    @callback
+    def _async_raw_changed(self, data: list[int]) -> None:
+        self._set_value(data)
+        self.async_write_ha_state()
+
+    @callback
+    def _update_attr(self) -> None:
+        self._set_value(self.coordinator.api.raw(
+            self._region, self._offset, self._length))
+
+    def _set_value(self, data: list[int]) -> None:
+        if self._length == 1:
+            self._attr_native_value = data[0]
+            return
+        self._attr_native_value = " ".join(f"{b:02x}" for b in data)
+        self._attr_extra_state_attributes = {
+            "ascii": "".join(chr(b) if 32 <= b < 127 else "." for b in data),
+        }
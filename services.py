@@ -0,0 +1,116 @@
+"""Services for the sygnal component."""
+from __future__ import annotations
+
+import time
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .chatterbox import InvalidArgument
+from .const import DOMAIN
+from .coordinator import SygnalDataUpdateCoordinator
+from .profiling import MODE_TIMING, MODES
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CYCLES = "cycles"
+ATTR_MODE = "mode"
+ATTR_TARGETS = "targets"
+ATTR_TIMEOUT = "timeout"
+ATTR_TOLERANCE = "tolerance"
+
+SERVICE_START_PROFILING = "start_profiling"
+SERVICE_STOP_PROFILING = "stop_profiling"
+SERVICE_WAIT_FOR = "wait_for"
+
+START_PROFILING_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=10): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+        vol.Optional(ATTR_MODE, default=MODE_TIMING): vol.In(MODES),
+    }
+)
+STOP_PROFILING_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+WAIT_FOR_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_TARGETS): vol.All(dict, vol.Length(min=1)),
+        vol.Optional(ATTR_TIMEOUT, default=30): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=600)
+        ),
+        vol.Optional(ATTR_TOLERANCE, default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+
+def _coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[SygnalDataUpdateCoordinator]:
+    """The coordinators a call applies to: the given entry, or all of them."""
+    coordinators = hass.data.get(DOMAIN, {})
+    if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is None:
+        return list(coordinators.values())
+    if entry_id not in coordinators:
+        raise ServiceValidationError(f"No loaded Sygnal config entry {entry_id}")
+    return [coordinators[entry_id]]
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services (once for all entries)."""
+    if hass.services.has_service(DOMAIN, SERVICE_START_PROFILING):
+        return
+
+    async def async_start_profiling(call: ServiceCall) -> None:
+        for coordinator in _coordinators(hass, call):
+            coordinator.async_start_profiling(call.data[ATTR_CYCLES], call.data[ATTR_MODE])
+
+    async def async_stop_profiling(call: ServiceCall) -> None:
+        for coordinator in _coordinators(hass, call):
+            await coordinator.async_stop_profiling()
+
+    async def async_wait_for(call: ServiceCall) -> ServiceResponse:
+        coordinators = _coordinators(hass, call)
+        if len(coordinators) != 1:
+            raise ServiceValidationError(
+                f"Specify {ATTR_CONFIG_ENTRY_ID} when several devices are set up")
+        coordinator = coordinators[0]
+        targets = call.data[ATTR_TARGETS]
+        start = time.monotonic()
+        try:
+            converged = await coordinator.api.async_wait_for(
+                targets, call.data[ATTR_TIMEOUT], call.data[ATTR_TOLERANCE])
+        except InvalidArgument as error:
+            raise ServiceValidationError(str(error)) from error
+        # The targeted reads refreshed part of VRAM; let entities catch up.
+        coordinator.async_update_listeners()
+        snapshot = coordinator.api.snapshot()
+        return {
+            "converged": converged,
+            "elapsed": round(time.monotonic() - start, 2),
+            "state": {field: snapshot.get(field) for field in targets},
+        }
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_PROFILING, async_start_profiling, START_PROFILING_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_PROFILING, async_stop_profiling, STOP_PROFILING_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WAIT_FOR,
+        async_wait_for,
+        WAIT_FOR_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
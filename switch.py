@@ -9,8 +9,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import SygnalDataUpdateCoordinator
 from .const import DOMAIN
+from .coordinator import SygnalDataUpdateCoordinator
 from .entity import SygnalEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -20,8 +20,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up a switch for each zone."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = [SygnalSwitch(coordinator, zone) for zone in coordinator.api.zones]
-    async_add_entities(entities)
+
+    @callback
+    def async_add_zone_entities() -> None:
+        async_add_entities([SygnalSwitch(coordinator, zone)
+                            for zone in coordinator.api.zones])
+
+    # Zone names come from the EEPROM, which may still be loading.
+    coordinator.async_add_zone_listener(async_add_zone_entities)
 
 class SygnalSwitch(SygnalEntity, SwitchEntity):
 
@@ -0,0 +1,5 @@
+"""Make the core modules (chatterbox, bridge, cli) importable by name."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,47 @@
+"""StreamBridge against an in-memory SygnalApi."""
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from bridge import StreamBridge  # noqa: E402
+from chatterbox import SygnalApi, SygnalClient  # noqa: E402
+
+
+def _api() -> SygnalApi:
+    api = SygnalApi(SygnalClient('10.0.0.1', None))
+    api._vram = [0] * 69
+    api._vram_loaded = True
+    return api
+
+
+def test_stop_with_connected_client():
+    async def run():
+        api = _api()
+        bridge = StreamBridge([api])
+        await bridge.async_start()
+        reader, writer = await asyncio.open_connection('127.0.0.1', bridge.port)
+        writer.write(b'{"fields": ["hvac_mode"]}\n')
+        await writer.drain()
+        line = json.loads(await asyncio.wait_for(reader.readline(), 2))
+        assert line['changes'] == {'hvac_mode': api.hvac_mode}
+
+        await asyncio.wait_for(bridge.async_stop(), 2)
+        assert api._subscriptions == []
+        assert await asyncio.wait_for(reader.read(), 2) == b''
+        writer.close()
+
+    asyncio.run(run())
+
+
+def test_subscription_keeps_latest_value_of_every_field():
+    api = _api()
+    subscription = api.subscribe(['hvac_mode', 'target_temperature'])
+    subscription.publish({'hvac_mode': 'cool', 'target_temperature': 20})
+    subscription.publish({'hvac_mode': 'heat'})
+
+    changes = asyncio.run(subscription.get())
+    assert changes == {'hvac_mode': 'heat', 'target_temperature': 20}
+    assert subscription.dropped >= 1
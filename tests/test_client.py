@@ -0,0 +1,59 @@
+"""SygnalClient request handling against a fake aiohttp session."""
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from chatterbox import REQUEST_TIMINGS, RequestTimings, SygnalClient  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self._body = body
+
+    async def text(self):
+        return json.dumps(self._body)
+
+
+class FakeSession:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.requests = []
+
+    async def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs['headers']['Host']))
+        await asyncio.sleep(self.delay)
+        if url.endswith('.json'):
+            return FakeResponse({'local': {'mac': '00:11:22:33:44:55'}})
+        return FakeResponse([{'values': [0] * 4}])
+
+
+def test_requests_go_to_address_with_hostname_header():
+    async def run():
+        session = FakeSession(0)
+        client = SygnalClient('10.0.0.1', session)
+        await client.get_device_info()
+        assert session.requests == [
+            ('GET', 'http://10.0.0.1/lv-lan-cboxes.json', '10.0.0.1')]
+
+    asyncio.run(run())
+
+
+def test_only_requests_in_the_timed_context_are_timed():
+    async def run():
+        client = SygnalClient('10.0.0.1', FakeSession())
+        timings = RequestTimings()
+
+        async def timed():
+            REQUEST_TIMINGS.set(timings)
+            await asyncio.gather(client.get_device_info(),
+                                 client.async_read_vram(0, 4))
+
+        await asyncio.gather(timed(), client.async_read_eeprom(0, 4))
+        # Two overlapping requests were timed; the EEPROM read wasn't.
+        assert 0.09 < timings.phases['network'] < 0.2
+        assert 0.04 < timings.waiting < 0.09
+
+    asyncio.run(run())
@@ -0,0 +1,47 @@
+"""SygnalApi EEPROM editing against a fake device."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from chatterbox import EepromWriteError, SygnalApi  # noqa: E402
+
+
+class FakeDevice:
+    """EEPROM that (like a wrong packet layout might) ignores the offset."""
+
+    def __init__(self, eeprom):
+        self.eeprom = list(eeprom)
+        self.hostname = 'fake'
+
+    async def async_write_eeprom(self, offset, length, value):
+        self.eeprom[0:4] = value
+
+    async def async_read_eeprom(self, offset, length):
+        return [{'values': self.eeprom[offset:offset + length]}]
+
+
+def _eeprom(names):
+    data = []
+    for name in names:
+        data += [ord(c) for c in name.ljust(8)]
+    return data + [0] * (150 - len(data))
+
+
+def test_failed_write_resyncs_cache():
+    async def run():
+        device = FakeDevice(_eeprom(['Lounge', 'Kitchen', 'Bed']))
+        api = SygnalApi(device)
+        api._eeprom = list(device.eeprom)
+        api._vram[39] = 0b111
+        api.update_zones()
+
+        with pytest.raises(EepromWriteError):
+            await api.async_rename_zone('Bed', 'Study')
+
+        assert api.eeprom == device.eeprom
+        assert 'Lounge' not in api.zones
+        assert 'Bed' in api.zones
+
+    asyncio.run(run())
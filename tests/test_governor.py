@@ -0,0 +1,58 @@
+"""LoadGovernor rate learning."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from chatterbox import LoadGovernor  # noqa: E402
+
+
+def test_no_increase_while_not_limiting():
+    async def run():
+        governor = LoadGovernor(rate=2.0, burst=4.0)
+        for _ in range(3):
+            await governor.acquire()
+            governor.record(0.01, True)
+        assert governor.rate == 2.0
+
+    asyncio.run(run())
+
+
+def test_increases_when_limiting():
+    async def run():
+        governor = LoadGovernor(rate=20.0, max_rate=50.0, burst=1.0, increase=0.5)
+        await governor.acquire()
+        governor.record(0.01, True)
+        await governor.acquire()
+        governor.record(0.01, True)
+        assert governor.rate == 21.0
+        assert governor.throttled >= 1
+
+    asyncio.run(run())
+
+
+def test_increase_capped_at_max_rate():
+    async def run():
+        governor = LoadGovernor(rate=20.0, max_rate=20.2, burst=1.0, increase=0.5)
+        await governor.acquire()
+        governor.record(0.01, True)
+        assert governor.rate == 20.2
+
+    asyncio.run(run())
+
+
+def test_failure_and_slow_requests_halve_rate_once_per_target():
+    governor = LoadGovernor(rate=4.0, latency_target=60.0)
+    governor.record(0.01, False)
+    assert governor.rate == 2.0
+    governor.record(120.0, True)
+    assert governor.rate == 2.0
+    assert (governor.errors, governor.slow) == (1, 1)
+
+
+def test_decrease_floored_at_min_rate():
+    governor = LoadGovernor(rate=0.3, min_rate=0.2, latency_target=0.0)
+    governor.record(5.0, True)
+    governor.record(5.0, True)
+    assert governor.rate == 0.2
@@ -0,0 +1,51 @@
+"""The core library must import quickly and without Home Assistant."""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.basename(PACKAGE_DIR)
+
+# Seconds, including aiohttp itself. Generous for slow CI machines; importing
+# Home Assistant alone takes several times this.
+IMPORT_BUDGET = 1.0
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {package}.chatterbox
+import {package}.cli
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "homeassistant": sorted(
+        name for name in sys.modules
+        if name == "homeassistant" or name.startswith("homeassistant.")),
+}}))
+"""
+
+
+def _import_in_subprocess() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT.format(package=PACKAGE)],
+        cwd=os.path.dirname(PACKAGE_DIR),
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_import_does_not_load_homeassistant():
+    assert _import_in_subprocess()["homeassistant"] == []
+
+
+def test_import_time_within_budget():
+    # Best of a few runs, so a busy machine doesn't fail the build.
+    elapsed = min(_import_in_subprocess()["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET, f"import took {elapsed:.3f}s"
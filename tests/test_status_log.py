@@ -0,0 +1,79 @@
+"""StatusLog counters, including across save/restore."""
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from chatterbox import STATUS_COMPRESSOR_RUNNING, StatusLog  # noqa: E402
+
+RUNNING = STATUS_COMPRESSOR_RUNNING
+# Another status bit, to change the byte without changing the compressor.
+OTHER = 0x20
+
+
+def _restored(log: StatusLog) -> StatusLog:
+    restored = StatusLog()
+    restored.restore(log.as_dict())
+    return restored
+
+
+def test_counts_starts_run_time_and_short_cycles():
+    log = StatusLog(short_cycle=300)
+    log.record(0, 0)
+    log.record(100, RUNNING)
+    log.record(200, 0)
+    log.record(1000, RUNNING)
+    assert log.record(1500, RUNNING) is False
+    log.record(2000, 0)
+    assert log.starts == 2
+    assert log.short_cycles == 1
+    assert log.run_time(2000) == 1100
+    assert log.starts_per_hour(2000) == 2
+    assert log.transitions == 5
+
+
+def test_restore_round_trips():
+    log = StatusLog()
+    log.record(0, 0)
+    log.record(100, RUNNING)
+    log.record(200, 0)
+    restored = _restored(log)
+    assert restored.as_dict() == log.as_dict()
+
+
+def test_run_ended_during_downtime_closes_at_last_seen():
+    log = StatusLog(short_cycle=300)
+    log.record(0, 0)
+    log.record(100, RUNNING)
+    log.record(200, RUNNING)
+    restored = _restored(log)
+    restored.record(50000, 0)
+    assert restored.run_time(50000) == 100
+    assert restored.short_cycles == 0
+    assert not restored.compressor_running
+
+
+def test_run_still_going_after_restore_skips_downtime():
+    log = StatusLog(short_cycle=300)
+    log.record(0, 0)
+    log.record(1000, RUNNING)
+    log.record(1100, RUNNING)
+    restored = _restored(log)
+    assert restored.record(5000, RUNNING) is False
+    assert restored.compressor_running
+    assert restored.run_time(5000) == 100
+    restored.record(5100, 0)
+    assert restored.run_time(5100) == 200
+    assert restored.starts == 1
+    assert restored.short_cycles == 0
+
+
+def test_other_status_bit_changing_after_restore_keeps_run_open():
+    log = StatusLog()
+    log.record(0, 0)
+    log.record(1000, RUNNING)
+    log.record(1100, RUNNING)
+    restored = _restored(log)
+    restored.record(1200, RUNNING | OTHER)
+    assert restored.compressor_running
+    assert restored.run_time(1600) == 500
+    assert restored.starts == 1